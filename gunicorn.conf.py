@@ -0,0 +1,40 @@
+"""
+Gunicorn configuration for the IRAS Callback API
+
+Usage: gunicorn main:application
+(gunicorn picks up ./gunicorn.conf.py automatically)
+"""
+
+import os
+
+# ================================
+# Server Socket
+# ================================
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# ================================
+# Worker Processes
+# ================================
+
+# Import main.py once in the master and fork workers from it, so the
+# precomputed response bytes, templates and validator tables are shared
+# copy-on-write instead of rebuilt per worker
+preload_app = True
+
+# Callback logs, stats counters and mock ID sequences live in process
+# memory, so a single worker keeps /logs consistent; concurrency comes
+# from threads. Extra workers are opt-in via WEB_CONCURRENCY.
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+threads = int(os.environ.get("GUNICORN_THREADS", 16))
+
+timeout = 30
+keepalive = 5
+
+# ================================
+# Logging
+# ================================
+
+# The app already logs every callback; leave gunicorn's access log off
+errorlog = "-"
@@ -14,17 +14,24 @@ Endpoints:
 Author: Generated for IRAS Integration Testing
 """
 
-from flask import Flask, request, jsonify, make_response
-from flask_cors import CORS
+from flask import Flask, Response, request, make_response, g
 from werkzeug.exceptions import BadRequest, NotFound, InternalServerError
+from werkzeug.http import generate_etag
 import json
+import orjson
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import threading
+import atexit
 from datetime import datetime
+import time
 import os
-import traceback
-import uuid
-from typing import Dict, List, Any, Optional
-import re
+from os import urandom
+from typing import Dict, Any, Optional, Deque, Tuple, Callable, Iterable
+from dataclasses import dataclass
+from collections import Counter, deque
+from itertools import count, islice
 
 # Configure logging
 logging.basicConfig(
@@ -33,29 +40,73 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Hand log records to a queue so request threads never block on handler I/O.
+# The configured handlers are moved onto a QueueListener, which writes them
+# from a background thread once startup_event() has run in this process.
+_log_queue: queue.Queue = queue.Queue(maxsize=10000)
+_root_logger = logging.getLogger()
+_log_listener = QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+
 # Initialize Flask app
 app = Flask(__name__)
 
-# Enable CORS for testing (configure domains for production)
-CORS(app, origins=["*"])
+# Enable CORS for testing (configure domains for production).
+# Headers are set directly instead of via flask-cors; like flask-cors with
+# origins="*", preflights are allowed whatever request headers they ask for.
+@app.after_request
+def add_cors_headers(response):
+    """Attach CORS headers, echoing the headers a preflight asks for"""
+    headers = response.headers
+    headers['Access-Control-Allow-Origin'] = '*'
+    headers['Access-Control-Allow-Methods'] = 'GET, POST, DELETE, OPTIONS'
+    requested_headers = request.headers.get('Access-Control-Request-Headers')
+    if request.method == 'OPTIONS' and requested_headers:
+        headers['Access-Control-Allow-Headers'] = requested_headers
+        headers.add('Vary', 'Access-Control-Request-Headers')
+    else:
+        headers['Access-Control-Allow-Headers'] = 'Content-Type'
+    return response
 
 # App configuration
 app.config.update(
     SECRET_KEY=os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production'),
-    JSON_SORT_KEYS=False,
-    JSONIFY_PRETTYPRINT_REGULAR=True
+    JSON_SORT_KEYS=False
 )
 
 # In-memory storage for testing (resets on restart)
-callback_logs: List[Dict[str, Any]] = []
 MAX_LOGS = 200  # Prevent memory issues
+callback_logs: Deque['LogEntry'] = deque(maxlen=MAX_LOGS)  # Ring buffer, oldest evicted
+
+# Running breakdowns of the buffered logs, kept in step with callback_logs
+status_counter: Counter = Counter()
+endpoint_counter: Counter = Counter()
+_logs_lock = threading.Lock()  # Guards callback_logs and the counters together
+
+# Only these request headers are retained in callback logs
+_LOGGED_HEADERS = ('Content-Type', 'User-Agent', 'X-Forwarded-For', 'X-Real-IP', 'X-Request-Id')
 
 # ================================
 # Data Validation Classes
 # ================================
 
+# Allowed enum values (frozensets for O(1) membership checks)
+_STATUS_ORDER = ('SUCCESS', 'FAILED', 'PROCESSING', 'PENDING', 'REJECTED', 'CANCELLED')
+_ALLOWED_STATUSES = frozenset(_STATUS_ORDER)
+_ALLOWED_STATUSES_STR = ', '.join(_STATUS_ORDER)
+_ALLOWED_FORM_TYPES = frozenset({'F5', 'F8'})
+
+# Exact-match lookups returning the canonical (upper-case) value, so the
+# common upper/lower-case inputs skip the .upper() allocation
+_STATUS_CANON = {s: s for s in _ALLOWED_STATUSES}
+_STATUS_CANON.update({s.lower(): s for s in _ALLOWED_STATUSES})
+_FORM_TYPE_CANON = {f: f for f in _ALLOWED_FORM_TYPES}
+_FORM_TYPE_CANON.update({f.lower(): f for f in _ALLOWED_FORM_TYPES})
+
 class ValidationError(Exception):
     """Custom validation error"""
+    __slots__ = ('message', 'field')
+    
     def __init__(self, message: str, field: str = None):
         self.message = message
         self.field = field
@@ -65,11 +116,11 @@ class CallbackValidator:
     """Validator class for IRAS callback data"""
     
     @staticmethod
-    def validate_required_fields(data: dict, required_fields: list) -> None:
-        """Validate that all required fields are present"""
-        missing_fields = [field for field in required_fields if not data.get(field)]
-        if missing_fields:
-            raise ValidationError(f"Missing required fields: {', '.join(missing_fields)}")
+    def validate_required_fields(data: dict, required_fields: Iterable[str]) -> None:
+        """Validate that all required fields are present (fails on the first missing one)"""
+        for field in required_fields:
+            if not data.get(field):
+                raise ValidationError(f"Missing required field: {field}", field=field)
     
     @staticmethod
     def validate_submission_status(status: str) -> str:
@@ -77,13 +128,11 @@ class CallbackValidator:
         if not status:
             raise ValidationError("submissionStatus is required")
         
-        allowed_statuses = ['SUCCESS', 'FAILED', 'PROCESSING', 'PENDING', 'REJECTED', 'CANCELLED']
-        status_upper = status.upper()
-        
-        if status_upper not in allowed_statuses:
-            raise ValidationError(f"Invalid status. Must be one of: {', '.join(allowed_statuses)}")
+        canonical = _STATUS_CANON.get(status) or _STATUS_CANON.get(status.upper())
+        if canonical is None:
+            raise ValidationError(f"Invalid status. Must be one of: {_ALLOWED_STATUSES_STR}")
         
-        return status_upper
+        return canonical
     
     @staticmethod
     def validate_uen(uen: str) -> str:
@@ -92,8 +141,9 @@ class CallbackValidator:
             raise ValidationError("companyUEN is required")
         
         # UEN format: 8 digits + letter OR 9 digits + letter
-        uen_pattern = r'^\d{8}[A-Z]$|^\d{9}[A-Z]$'
-        if not re.match(uen_pattern, uen):
+        prefix = uen[:-1]
+        if (len(uen) not in (9, 10) or not ('A' <= uen[-1] <= 'Z')
+                or not (prefix.isascii() and prefix.isdigit())):
             raise ValidationError("Invalid UEN format. Expected format: 12345678A or 123456789A")
         
         return uen
@@ -104,11 +154,30 @@ class CallbackValidator:
         if not form_type:
             raise ValidationError("formType is required")
         
-        form_type_upper = form_type.upper()
-        if form_type_upper not in ['F5', 'F8']:
+        canonical = _FORM_TYPE_CANON.get(form_type) or _FORM_TYPE_CANON.get(form_type.upper())
+        if canonical is None:
             raise ValidationError("Invalid formType. Must be F5 or F8")
         
-        return form_type_upper
+        return canonical
+    
+    @staticmethod
+    def validate_non_negative_number(value: Any, field: str, number_type: type = float) -> Any:
+        """Validate an optional non-negative number, coercing it to number_type"""
+        if value is None:
+            return None
+        
+        # JSON numbers already of the target type skip the conversion
+        if type(value) is not number_type:
+            try:
+                value = number_type(value)
+            except (ValueError, TypeError):
+                kind = "integer" if number_type is int else "number"
+                raise ValidationError(f"{field} must be a valid {kind}", field=field)
+        
+        if value < 0:
+            raise ValidationError(f"{field} must be non-negative", field=field)
+        
+        return value
     
     @staticmethod
     def validate_tax_period(tax_period: str) -> str:
@@ -116,7 +185,8 @@ class CallbackValidator:
         if not tax_period:
             raise ValidationError("taxPeriod is required")
         
-        if not re.match(r'^\d{6}$', tax_period):
+        # YYYYMM: exactly six ASCII digits
+        if not (len(tax_period) == 6 and tax_period.isascii() and tax_period.isdigit()):
             raise ValidationError("Invalid taxPeriod format. Expected format: YYYYMM (e.g., 202412)")
         
         # Basic date validation
@@ -132,18 +202,94 @@ class CallbackValidator:
         
         return tax_period
 
+# ================================
+# Callback Log Storage
+# ================================
+
+class LogEntry:
+    """Single callback log record (slotted to keep the ring buffer compact)"""
+    __slots__ = ('request_id', 'timestamp', 'endpoint', 'callback_data',
+                 'headers', 'client_ip', 'method', 'status')
+    
+    def __init__(self, request_id: str, timestamp: str, endpoint: str,
+                 callback_data: Dict[str, Any], headers: Dict[str, str],
+                 client_ip: str, method: str, status: str):
+        self.request_id = request_id
+        self.timestamp = timestamp
+        self.endpoint = endpoint
+        self.callback_data = callback_data
+        self.headers = headers
+        self.client_ip = client_ip
+        self.method = method
+        self.status = status
+    
+    def to_dict(self) -> dict:
+        """Return the JSON representation exposed by /logs"""
+        return {
+            "requestId": self.request_id,
+            "timestamp": self.timestamp,
+            "endpoint": self.endpoint,
+            "callback_data": self.callback_data,
+            "headers": self.headers,
+            "client_ip": self.client_ip,
+            "method": self.method,
+            "status": self.status
+        }
+
 # ================================
 # Utility Functions
 # ================================
 
 def get_client_ip() -> str:
-    """Get client IP address with proxy support"""
-    if request.headers.get('X-Forwarded-For'):
-        return request.headers.get('X-Forwarded-For').split(',')[0].strip()
-    elif request.headers.get('X-Real-IP'):
-        return request.headers.get('X-Real-IP')
-    else:
-        return request.remote_addr or 'unknown'
+    """Get client IP address with proxy support (resolved once per request)"""
+    client_ip = g.get('client_ip')
+    if client_ip is None:
+        headers = request.headers
+        forwarded_for = headers.get('X-Forwarded-For')
+        if forwarded_for:
+            client_ip = forwarded_for.partition(',')[0].strip()
+        else:
+            client_ip = headers.get('X-Real-IP') or request.remote_addr or 'unknown'
+        g.client_ip = client_ip
+    return client_ip
+
+# (epoch second, ISO timestamp, compact YYYYmmddHHMMSS stamp) shared across requests
+_clock_cache = (0, '', '')
+_id_counter = count()
+_id_pid = f"{os.getpid():07d}"  # Keeps IDs unique across forked gunicorn workers
+
+def _reset_id_state():
+    """Give a forked child its own PID component and sequence"""
+    global _id_counter, _id_pid
+    _id_counter = count()
+    _id_pid = f"{os.getpid():07d}"
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_id_state)
+
+def _current_clock() -> Tuple[int, str, str]:
+    """Return the cached clock tuple, re-rendered at most once per second"""
+    global _clock_cache
+    now = int(time.time())
+    clock = _clock_cache
+    if clock[0] != now:
+        moment = datetime.fromtimestamp(now)
+        clock = (now, moment.isoformat(), moment.strftime('%Y%m%d%H%M%S'))
+        _clock_cache = clock  # Single assignment keeps readers consistent
+    return clock
+
+def _now_iso() -> str:
+    """Current local time in ISO format (one-second resolution)"""
+    return _current_clock()[1]
+
+def _generate_id(prefix: str) -> str:
+    """Build a unique ID from prefix, YYYYmmddHHMMSS stamp, process ID and 6-digit sequence"""
+    return f"{prefix}{_current_clock()[2]}{_id_pid}{next(_id_counter) % 1000000:06d}"
+
+@app.before_request
+def capture_request_context():
+    """Resolve per-request values once so helpers can reuse them"""
+    g.now_iso = _now_iso()
 
 def log_callback(endpoint: str, callback_data: Dict[str, Any]) -> str:
     """
@@ -156,31 +302,45 @@ def log_callback(endpoint: str, callback_data: Dict[str, Any]) -> str:
     Returns:
         str: Unique request ID for tracking
     """
-    request_id = str(uuid.uuid4())[:8]  # Short unique ID
+    request_id = urandom(4).hex()  # Short unique ID
     client_ip = get_client_ip()
+    headers = request.headers
     
-    log_entry = {
-        "requestId": request_id,
-        "timestamp": datetime.now().isoformat(),
-        "endpoint": endpoint,
-        "callback_data": callback_data,
-        "headers": dict(request.headers),
-        "client_ip": client_ip,
-        "method": request.method,
-        "status": callback_data.get('submissionStatus', 'UNKNOWN')
-    }
+    log_entry = LogEntry(
+        request_id,
+        g.now_iso,
+        endpoint,
+        callback_data,
+        {name: headers.get(name) for name in _LOGGED_HEADERS if name in headers},
+        client_ip,
+        request.method,
+        callback_data.get('submissionStatus', 'UNKNOWN')
+    )
     
-    # Add to logs and maintain size limit
-    callback_logs.append(log_entry)
-    if len(callback_logs) > MAX_LOGS:
-        callback_logs.pop(0)  # Remove oldest log
+    # Add to logs (deque maxlen evicts the oldest entry) and update breakdowns
+    with _logs_lock:
+        if len(callback_logs) == MAX_LOGS:
+            evicted = callback_logs[0]
+            status_counter[evicted.status] -= 1
+            endpoint_counter[evicted.endpoint] -= 1
+        callback_logs.append(log_entry)
+        status_counter[log_entry.status] += 1
+        endpoint_counter[endpoint] += 1
     
-    # Log to console for monitoring
-    logger.info(f"📨 {endpoint} callback received - Request ID: {request_id}")
-    logger.info(f"   Submission ID: {callback_data.get('submissionId', 'N/A')}")
-    logger.info(f"   Status: {callback_data.get('submissionStatus', 'N/A')}")
-    logger.info(f"   Company UEN: {callback_data.get('companyUEN', 'N/A')}")
-    logger.info(f"   Client IP: {client_ip}")
+    # Log to console for monitoring (single record, formatted lazily)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "📨 %s callback received - Request ID: %s\n"
+            "   Submission ID: %s\n"
+            "   Status: %s\n"
+            "   Company UEN: %s\n"
+            "   Client IP: %s",
+            endpoint, request_id,
+            callback_data.get('submissionId', 'N/A'),
+            callback_data.get('submissionStatus', 'N/A'),
+            callback_data.get('companyUEN', 'N/A'),
+            client_ip
+        )
     
     return request_id
 
@@ -190,7 +350,7 @@ def create_success_response(message: str, submission_id: str, request_id: str) -
         "status": "received",
         "message": message,
         "submissionId": submission_id,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": g.now_iso,
         "requestId": request_id
     }
 
@@ -206,24 +366,25 @@ def create_error_response(error: Exception, submission_id: str = None, status_co
     Returns:
         tuple: (response_dict, status_code)
     """
-    error_id = str(uuid.uuid4())[:8]
+    error_id = urandom(4).hex()
     error_detail = str(error)
     
-    logger.error(f"❌ Callback processing error - Error ID: {error_id}")
-    logger.error(f"   Error: {error_detail}")
-    logger.error(f"   Submission ID: {submission_id or 'N/A'}")
-    logger.error(f"   Endpoint: {request.endpoint}")
-    logger.error(f"   Method: {request.method}")
-    logger.error(f"   Client IP: {get_client_ip()}")
+    logger.error("❌ Callback processing error - Error ID: %s", error_id)
+    logger.error("   Error: %s", error_detail)
+    logger.error("   Submission ID: %s", submission_id or 'N/A')
+    logger.error("   Endpoint: %s", request.endpoint)
+    logger.error("   Method: %s", request.method)
+    logger.error("   Client IP: %s", get_client_ip())
     if status_code >= 500:  # Only log traceback for server errors
-        logger.error(f"   Traceback: {traceback.format_exc()}")
+        # exc_info defers traceback formatting until the record is emitted
+        logger.error("   Traceback:", exc_info=True)
     
     response = {
         "status": "error",
         "message": "Error processing callback" if status_code >= 500 else error_detail,
         "error_id": error_id,
         "submissionId": submission_id,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": g.now_iso
     }
     
     # Include error details for validation errors
@@ -234,54 +395,169 @@ def create_error_response(error: Exception, submission_id: str = None, status_co
     
     return response, status_code
 
+class ORJSONResponse(Response):
+    """Response class whose bodies are orjson-encoded JSON bytes"""
+    default_mimetype = 'application/json'
+
+def _json_response(payload: Any, status: int = 200) -> ORJSONResponse:
+    """Serialize payload with orjson and wrap it in a JSON response"""
+    try:
+        body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # orjson rejects integers wider than 64 bits; the stdlib encoder does not
+        body = json.dumps(payload, ensure_ascii=False, separators=(',', ':'), default=str).encode()
+    return ORJSONResponse(body, status=status)
+
+def _static_json_response(body: bytes, etag: str) -> ORJSONResponse:
+    """Serve a pre-serialized JSON body with ETag and cache headers"""
+    response = ORJSONResponse(body)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
+
 def validate_json_payload() -> dict:
     """Validate and return JSON payload from request"""
     if not request.is_json:
         raise ValidationError("Content-Type must be application/json")
     
     try:
-        data = request.get_json()
-        if data is None:
-            raise ValidationError("Request body must contain valid JSON")
-        return data
-    except Exception as e:
+        # Parse the raw body with orjson; cache=False avoids keeping a second copy
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError as e:
         raise ValidationError(f"Invalid JSON payload: {str(e)}")
+    
+    if data is None:
+        raise ValidationError("Request body must contain valid JSON")
+    return data
 
 # ================================
 # Health and Info Endpoints
 # ================================
 
+# Static API information served at /
+_ROOT_INFO = {
+    "message": "IRAS Callback API Server",
+    "status": "healthy",
+    "platform": " App Hosting + Flask",
+    "version": "1.0.0",
+    "framework": "Flask",
+    "endpoints": {
+        "gst_return": "/iras/gst-return/callback",
+        "form_cs": "/iras/form-cs/callback",
+        "commission_records": "/iras/commission-records/callback",
+        "donation_records": "/iras/donation-records/callback",
+        "e_stamping": "/iras/e-stamping/callback",
+        "health": "/health",
+        "logs": "/logs"
+    },
+    "documentation": "Visit /docs for endpoint documentation"
+}
+
+# Static API documentation served at /docs
+_API_DOCS = {
+    "title": "IRAS Callback API Documentation",
+    "version": "1.0.0",
+    "description": "Comprehensive callback API for IRAS services",
+    "endpoints": [
+        {
+            "path": "/iras/gst-return/callback",
+            "method": "POST",
+            "description": "GST Return submission callback (F5, F8)",
+            "required_fields": [
+                "submissionId", "submissionStatus", "formType", 
+                "submissionDateTime", "companyUEN", "taxPeriod"
+            ],
+            "optional_fields": [
+                "acknowledgementNumber", "totalTaxAmount", "errors"
+            ]
+        },
+        {
+            "path": "/iras/form-cs/callback",
+            "method": "POST",
+            "description": "Corporate Secretary form submission callback",
+            "required_fields": [
+                "submissionId", "submissionStatus", "submissionDateTime", 
+                "companyUEN", "formVersion", "filingType"
+            ],
+            "optional_fields": [
+                "effectiveDate", "acknowledgementNumber", "errors"
+            ]
+        },
+        {
+            "path": "/iras/commission-records/callback",
+            "method": "POST",
+            "description": "Commission records submission callback",
+            "required_fields": [
+                "submissionId", "submissionStatus", "submissionDateTime", 
+                "companyUEN", "recordType", "recordPeriod"
+            ],
+            "optional_fields": [
+                "totalRecords", "totalCommissionAmount", "acknowledgementNumber", "errors"
+            ]
+        },
+        {
+            "path": "/iras/donation-records/callback",
+            "method": "POST",
+            "description": "Donation records submission callback",
+            "required_fields": [
+                "submissionId", "submissionStatus", "submissionDateTime", 
+                "companyUEN", "donationType", "donationPeriod"
+            ],
+            "optional_fields": [
+                "totalDonations", "totalDonationAmount", "acknowledgementNumber", "errors"
+            ]
+        },
+        {
+            "path": "/iras/e-stamping/callback",
+            "method": "POST",
+            "description": "E-stamping submission callback",
+            "required_fields": [
+                "submissionId", "submissionStatus", "submissionDateTime", 
+                "companyUEN", "documentType"
+            ],
+            "optional_fields": [
+                "stampDuty", "stampCertificateNumber", "acknowledgementNumber", "errors"
+            ]
+        }
+    ],
+    "example_payload": {
+        "submissionId": "GST202501001234",
+        "submissionStatus": "SUCCESS",
+        "submissionDateTime": "2025-01-15T14:30:00+08:00",
+        "companyUEN": "201234567D",
+        "formType": "F5",
+        "taxPeriod": "202412",
+        "acknowledgementNumber": "ACK123456789",
+        "totalTaxAmount": 15000.50
+    }
+}
+
+# Static payloads are serialized once at import and served as cached bytes
+_ROOT_BYTES = orjson.dumps(_ROOT_INFO)
+_ROOT_ETAG = generate_etag(_ROOT_BYTES)
+_DOCS_BYTES = orjson.dumps(_API_DOCS)
+_DOCS_ETAG = generate_etag(_DOCS_BYTES)
+
 @app.route("/", methods=["GET"])
 def root():
     """Root endpoint with API information"""
-    return jsonify({
-        "message": "IRAS Callback API Server",
-        "status": "healthy",
-        "platform": " App Hosting + Flask",
-        "version": "1.0.0",
-        "framework": "Flask",
-        "endpoints": {
-            "gst_return": "/iras/gst-return/callback",
-            "form_cs": "/iras/form-cs/callback",
-            "commission_records": "/iras/commission-records/callback",
-            "donation_records": "/iras/donation-records/callback",
-            "e_stamping": "/iras/e-stamping/callback",
-            "health": "/health",
-            "logs": "/logs"
-        },
-        "documentation": "Visit /docs for endpoint documentation"
-    })
+    return _static_json_response(_ROOT_BYTES, _ROOT_ETAG)
+
+@app.route("/docs", methods=["GET"])
+def api_documentation():
+    """API documentation endpoint"""
+    return _static_json_response(_DOCS_BYTES, _DOCS_ETAG)
 
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint for monitoring"""
     try:
-        current_time = datetime.now().isoformat()
         log_count = len(callback_logs)
         
-        return jsonify({
+        return _json_response({
             "status": "healthy",
-            "timestamp": current_time,
+            "timestamp": g.now_iso,
             "platform": " App Hosting + Flask",
             "logs_count": log_count,
             "memory_usage": "normal" if log_count < MAX_LOGS * 0.8 else "high",
@@ -289,181 +565,244 @@ def health_check():
             "flask_version": "2.3.3"
         })
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
+        logger.error("Health check failed: %s", e)
         response, status_code = create_error_response(e, status_code=503)
-        return jsonify(response), status_code
-
-@app.route("/docs", methods=["GET"])
-def api_documentation():
-    """API documentation endpoint"""
-    docs = {
-        "title": "IRAS Callback API Documentation",
-        "version": "1.0.0",
-        "description": "Comprehensive callback API for IRAS services",
-        "endpoints": [
-            {
-                "path": "/iras/gst-return/callback",
-                "method": "POST",
-                "description": "GST Return submission callback (F5, F8)",
-                "required_fields": [
-                    "submissionId", "submissionStatus", "formType", 
-                    "submissionDateTime", "companyUEN", "taxPeriod"
-                ],
-                "optional_fields": [
-                    "acknowledgementNumber", "totalTaxAmount", "errors"
-                ]
-            },
-            {
-                "path": "/iras/form-cs/callback",
-                "method": "POST",
-                "description": "Corporate Secretary form submission callback",
-                "required_fields": [
-                    "submissionId", "submissionStatus", "submissionDateTime", 
-                    "companyUEN", "formVersion", "filingType"
-                ],
-                "optional_fields": [
-                    "effectiveDate", "acknowledgementNumber", "errors"
-                ]
-            },
-            {
-                "path": "/iras/commission-records/callback",
-                "method": "POST",
-                "description": "Commission records submission callback",
-                "required_fields": [
-                    "submissionId", "submissionStatus", "submissionDateTime", 
-                    "companyUEN", "recordType", "recordPeriod"
-                ],
-                "optional_fields": [
-                    "totalRecords", "totalCommissionAmount", "acknowledgementNumber", "errors"
-                ]
-            },
-            {
-                "path": "/iras/donation-records/callback",
-                "method": "POST",
-                "description": "Donation records submission callback",
-                "required_fields": [
-                    "submissionId", "submissionStatus", "submissionDateTime", 
-                    "companyUEN", "donationType", "donationPeriod"
-                ],
-                "optional_fields": [
-                    "totalDonations", "totalDonationAmount", "acknowledgementNumber", "errors"
-                ]
-            },
-            {
-                "path": "/iras/e-stamping/callback",
-                "method": "POST",
-                "description": "E-stamping submission callback",
-                "required_fields": [
-                    "submissionId", "submissionStatus", "submissionDateTime", 
-                    "companyUEN", "documentType"
-                ],
-                "optional_fields": [
-                    "stampDuty", "stampCertificateNumber", "acknowledgementNumber", "errors"
-                ]
-            }
-        ],
-        "example_payload": {
-            "submissionId": "GST202501001234",
-            "submissionStatus": "SUCCESS",
-            "submissionDateTime": "2025-01-15T14:30:00+08:00",
-            "companyUEN": "201234567D",
-            "formType": "F5",
-            "taxPeriod": "202412",
-            "acknowledgementNumber": "ACK123456789",
-            "totalTaxAmount": 15000.50
-        }
-    }
-    
-    return jsonify(docs)
+        return _json_response(response, status_code)
 
 # ================================
-# IRAS Callback Endpoints
+# Callback Specifications
 # ================================
 
-@app.route("/iras/gst-return/callback", methods=["POST"])
-def gst_return_callback():
+@dataclass(frozen=True)
+class CallbackSpec:
+    """Per-endpoint configuration for the shared callback handler"""
+    name: str                    # Log tag, e.g. "GST-RETURN"
+    title: str                   # Subject used in log lines, formatted with callback data
+    required_fields: Tuple[str, ...]
+    output_fields: Tuple[str, ...]  # Keys of the normalized callback data, in order
+    validators: Tuple[Tuple[str, Callable[[Any], Any]], ...]  # Run in order
+    success_message: str
+    failed_message: str
+    pending_message: str         # Also receives {status} (lower-case)
+    numeric_fields: Tuple[Tuple[str, type], ...] = ()  # Optional non-negative numbers
+    success_details: Tuple[Tuple[str, str], ...] = ()  # (log template, field), logged when set
+
+GST_RETURN_SPEC = CallbackSpec(
+    name="GST-RETURN",
+    title="GST {formType}",
+    required_fields=(
+        'submissionId', 'submissionStatus', 'formType',
+        'submissionDateTime', 'companyUEN', 'taxPeriod'
+    ),
+    output_fields=(
+        'submissionId', 'submissionStatus', 'formType', 'submissionDateTime', 'companyUEN',
+        'taxPeriod', 'acknowledgementNumber', 'totalTaxAmount', 'errors'
+    ),
+    validators=(
+        ('submissionStatus', CallbackValidator.validate_submission_status),
+        ('formType', CallbackValidator.validate_form_type),
+        ('companyUEN', CallbackValidator.validate_uen),
+        ('taxPeriod', CallbackValidator.validate_tax_period),
+    ),
+    success_message="GST {formType} submission for period {taxPeriod} processed successfully",
+    failed_message="GST {formType} submission for period {taxPeriod} failed",
+    pending_message="GST {formType} submission for period {taxPeriod} is {status}",
+    numeric_fields=(('totalTaxAmount', float),),
+    success_details=(
+        ("   ACK Number: {}", 'acknowledgementNumber'),
+        ("   Total Tax: ${:,.2f}", 'totalTaxAmount'),
+    ),
+)
+
+FORM_CS_SPEC = CallbackSpec(
+    name="FORM-CS",
+    title="Form CS",
+    required_fields=(
+        'submissionId', 'submissionStatus', 'submissionDateTime',
+        'companyUEN', 'formVersion', 'filingType'
+    ),
+    output_fields=(
+        'submissionId', 'submissionStatus', 'submissionDateTime', 'companyUEN',
+        'formVersion', 'filingType', 'effectiveDate', 'acknowledgementNumber', 'errors'
+    ),
+    validators=(
+        ('submissionStatus', CallbackValidator.validate_submission_status),
+        ('companyUEN', CallbackValidator.validate_uen),
+    ),
+    success_message="Form CS ({filingType}) submission processed successfully",
+    failed_message="Form CS ({filingType}) submission failed",
+    pending_message="Form CS ({filingType}) submission is {status}",
+    success_details=(
+        ("   Filing Type: {}", 'filingType'),
+        ("   Effective Date: {}", 'effectiveDate'),
+    ),
+)
+
+COMMISSION_RECORDS_SPEC = CallbackSpec(
+    name="COMMISSION-RECORDS",
+    title="Commission records",
+    required_fields=(
+        'submissionId', 'submissionStatus', 'submissionDateTime',
+        'companyUEN', 'recordType', 'recordPeriod'
+    ),
+    output_fields=(
+        'submissionId', 'submissionStatus', 'submissionDateTime', 'companyUEN',
+        'recordType', 'recordPeriod', 'totalRecords', 'totalCommissionAmount',
+        'acknowledgementNumber', 'errors'
+    ),
+    validators=(
+        ('submissionStatus', CallbackValidator.validate_submission_status),
+        ('companyUEN', CallbackValidator.validate_uen),
+    ),
+    success_message="Commission records ({recordType}) for {recordPeriod} processed successfully",
+    failed_message="Commission records ({recordType}) submission failed",
+    pending_message="Commission records ({recordType}) submission is {status}",
+    numeric_fields=(('totalRecords', int), ('totalCommissionAmount', float)),
+    success_details=(
+        ("   Record Type: {}", 'recordType'),
+        ("   Period: {}", 'recordPeriod'),
+        ("   Total Records: {}", 'totalRecords'),
+        ("   Total Commission: ${:,.2f}", 'totalCommissionAmount'),
+    ),
+)
+
+DONATION_RECORDS_SPEC = CallbackSpec(
+    name="DONATION-RECORDS",
+    title="Donation records",
+    required_fields=(
+        'submissionId', 'submissionStatus', 'submissionDateTime',
+        'companyUEN', 'donationType', 'donationPeriod'
+    ),
+    output_fields=(
+        'submissionId', 'submissionStatus', 'submissionDateTime', 'companyUEN',
+        'donationType', 'donationPeriod', 'totalDonations', 'totalDonationAmount',
+        'acknowledgementNumber', 'errors'
+    ),
+    validators=(
+        ('submissionStatus', CallbackValidator.validate_submission_status),
+        ('companyUEN', CallbackValidator.validate_uen),
+    ),
+    success_message="Donation records ({donationType}) for {donationPeriod} processed successfully",
+    failed_message="Donation records ({donationType}) submission failed",
+    pending_message="Donation records ({donationType}) submission is {status}",
+    numeric_fields=(('totalDonations', int), ('totalDonationAmount', float)),
+    success_details=(
+        ("   Donation Type: {}", 'donationType'),
+        ("   Period: {}", 'donationPeriod'),
+        ("   Total Donations: {}", 'totalDonations'),
+        ("   Total Amount: ${:,.2f}", 'totalDonationAmount'),
+    ),
+)
+
+E_STAMPING_SPEC = CallbackSpec(
+    name="E-STAMPING",
+    title="E-stamping",
+    required_fields=(
+        'submissionId', 'submissionStatus', 'submissionDateTime',
+        'companyUEN', 'documentType'
+    ),
+    output_fields=(
+        'submissionId', 'submissionStatus', 'submissionDateTime', 'companyUEN',
+        'documentType', 'stampDuty', 'stampCertificateNumber', 'acknowledgementNumber', 'errors'
+    ),
+    validators=(
+        ('submissionStatus', CallbackValidator.validate_submission_status),
+        ('companyUEN', CallbackValidator.validate_uen),
+    ),
+    success_message="E-stamping for {documentType} processed successfully",
+    failed_message="E-stamping for {documentType} submission failed",
+    pending_message="E-stamping for {documentType} submission is {status}",
+    numeric_fields=(('stampDuty', float),),
+    success_details=(
+        ("   Document Type: {}", 'documentType'),
+        ("   Stamp Duty: ${:,.2f}", 'stampDuty'),
+        ("   Certificate Number: {}", 'stampCertificateNumber'),
+    ),
+)
+
+def _process_callback(spec: CallbackSpec) -> ORJSONResponse:
     """
-    GST Return submission callback endpoint (F5, F8)
+    Validate, log and acknowledge a callback described by spec
     
-    This endpoint receives callbacks from IRAS after GST return processing.
-    Handles both successful and failed submissions with proper validation.
+    Args:
+        spec: The endpoint's callback specification
+        
+    Returns:
+        ORJSONResponse: JSON acknowledgement, or the error response
     """
     submission_id = None
     try:
         # Validate and extract JSON payload
         data = validate_json_payload()
-        
-        # Validate required fields
-        required_fields = [
-            'submissionId', 'submissionStatus', 'formType', 
-            'submissionDateTime', 'companyUEN', 'taxPeriod'
-        ]
-        CallbackValidator.validate_required_fields(data, required_fields)
-        
-        # Extract and validate individual fields
+        CallbackValidator.validate_required_fields(data, spec.required_fields)
         submission_id = data['submissionId']
-        submission_status = CallbackValidator.validate_submission_status(data['submissionStatus'])
-        form_type = CallbackValidator.validate_form_type(data['formType'])
-        company_uen = CallbackValidator.validate_uen(data['companyUEN'])
-        tax_period = CallbackValidator.validate_tax_period(data['taxPeriod'])
         
-        # Optional fields with validation
-        ack_number = data.get('acknowledgementNumber')
-        total_tax = data.get('totalTaxAmount')
-        errors = data.get('errors', [])
+        # Create normalized callback data, then validate individual fields
+        callback_data = {field: data.get(field) for field in spec.output_fields}
+        callback_data['errors'] = data.get('errors', [])
+        for field, validator in spec.validators:
+            callback_data[field] = validator(data[field])
         
-        if total_tax is not None:
-            try:
-                total_tax = float(total_tax)
-                if total_tax < 0:
-                    raise ValidationError("totalTaxAmount must be non-negative")
-            except (ValueError, TypeError):
-                raise ValidationError("totalTaxAmount must be a valid number")
-        
-        # Create normalized callback data
-        callback_data = {
-            'submissionId': submission_id,
-            'submissionStatus': submission_status,
-            'formType': form_type,
-            'submissionDateTime': data['submissionDateTime'],
-            'companyUEN': company_uen,
-            'taxPeriod': tax_period,
-            'acknowledgementNumber': ack_number,
-            'totalTaxAmount': total_tax,
-            'errors': errors
-        }
+        # Optional numeric fields must be non-negative numbers
+        for field, number_type in spec.numeric_fields:
+            callback_data[field] = CallbackValidator.validate_non_negative_number(
+                data.get(field), field, number_type)
         
         # Log the callback
-        request_id = log_callback("GST-RETURN", callback_data)
+        request_id = log_callback(spec.name, callback_data)
         
         # Process based on status
+        submission_status = callback_data['submissionStatus']
+        errors = callback_data['errors']
         if submission_status == "SUCCESS":
-            logger.info(f"✅ GST {form_type} submission successful!")
-            if ack_number:
-                logger.info(f"   ACK Number: {ack_number}")
-            if total_tax:
-                logger.info(f"   Total Tax: ${total_tax:,.2f}")
-            message = f"GST {form_type} submission for period {tax_period} processed successfully"
+            # Routine success lines: skip title/detail formatting when INFO is off
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✅ %s submission successful!", spec.title.format(**callback_data))
+                for template, field in spec.success_details:
+                    if callback_data[field]:
+                        logger.info(template.format(callback_data[field]))
+            message = spec.success_message.format(**callback_data)
             
         elif submission_status == "FAILED":
-            logger.warning(f"❌ GST {form_type} submission failed")
-            if errors:
-                logger.warning(f"   Errors: {', '.join(errors)}")
-            message = f"GST {form_type} submission for period {tax_period} failed"
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("❌ %s submission failed", spec.title.format(**callback_data))
+                if errors:
+                    # Stringify items so non-string errors cannot fail the request
+                    # only when WARNING happens to be enabled
+                    error_text = (', '.join(map(str, errors))
+                                  if isinstance(errors, (list, tuple)) else str(errors))
+                    logger.warning("   Errors: %s", error_text)
+            message = spec.failed_message.format(**callback_data)
             
         else:  # PROCESSING, PENDING, etc.
-            logger.info(f"⏳ GST {form_type} submission status: {submission_status}")
-            message = f"GST {form_type} submission for period {tax_period} is {submission_status.lower()}"
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("⏳ %s submission status: %s",
+                            spec.title.format(**callback_data), submission_status)
+            message = spec.pending_message.format(status=submission_status.lower(), **callback_data)
         
         response = create_success_response(message, submission_id, request_id)
-        return jsonify(response), 200
+        return _json_response(response, 200)
         
     except ValidationError as e:
         response, status_code = create_error_response(e, submission_id, 400)
-        return jsonify(response), status_code
+        return _json_response(response, status_code)
     except Exception as e:
         response, status_code = create_error_response(e, submission_id, 500)
-        return jsonify(response), status_code
+        return _json_response(response, status_code)
+
+# ================================
+# IRAS Callback Endpoints
+# ================================
+
+@app.route("/iras/gst-return/callback", methods=["POST"])
+def gst_return_callback():
+    """
+    GST Return submission callback endpoint (F5, F8)
+    
+    This endpoint receives callbacks from IRAS after GST return processing.
+    Handles both successful and failed submissions with proper validation.
+    """
+    return _process_callback(GST_RETURN_SPEC)
 
 @app.route("/iras/form-cs/callback", methods=["POST"])
 def form_cs_callback():
@@ -472,60 +811,7 @@ def form_cs_callback():
     
     Handles callbacks for corporate secretary filings and changes.
     """
-    submission_id = None
-    try:
-        data = validate_json_payload()
-        
-        required_fields = [
-            'submissionId', 'submissionStatus', 'submissionDateTime', 
-            'companyUEN', 'formVersion', 'filingType'
-        ]
-        CallbackValidator.validate_required_fields(data, required_fields)
-        
-        submission_id = data['submissionId']
-        submission_status = CallbackValidator.validate_submission_status(data['submissionStatus'])
-        company_uen = CallbackValidator.validate_uen(data['companyUEN'])
-        
-        callback_data = {
-            'submissionId': submission_id,
-            'submissionStatus': submission_status,
-            'submissionDateTime': data['submissionDateTime'],
-            'companyUEN': company_uen,
-            'formVersion': data['formVersion'],
-            'filingType': data['filingType'],
-            'effectiveDate': data.get('effectiveDate'),
-            'acknowledgementNumber': data.get('acknowledgementNumber'),
-            'errors': data.get('errors', [])
-        }
-        
-        request_id = log_callback("FORM-CS", callback_data)
-        
-        if submission_status == "SUCCESS":
-            logger.info(f"✅ Form CS submission successful!")
-            logger.info(f"   Filing Type: {data['filingType']}")
-            if data.get('effectiveDate'):
-                logger.info(f"   Effective Date: {data['effectiveDate']}")
-            message = f"Form CS ({data['filingType']}) submission processed successfully"
-            
-        elif submission_status == "FAILED":
-            logger.warning(f"❌ Form CS submission failed")
-            if data.get('errors'):
-                logger.warning(f"   Errors: {', '.join(data['errors'])}")
-            message = f"Form CS ({data['filingType']}) submission failed"
-            
-        else:
-            logger.info(f"⏳ Form CS submission status: {submission_status}")
-            message = f"Form CS ({data['filingType']}) submission is {submission_status.lower()}"
-        
-        response = create_success_response(message, submission_id, request_id)
-        return jsonify(response), 200
-        
-    except ValidationError as e:
-        response, status_code = create_error_response(e, submission_id, 400)
-        return jsonify(response), status_code
-    except Exception as e:
-        response, status_code = create_error_response(e, submission_id, 500)
-        return jsonify(response), status_code
+    return _process_callback(FORM_CS_SPEC)
 
 @app.route("/iras/commission-records/callback", methods=["POST"])
 def commission_records_callback():
@@ -534,84 +820,7 @@ def commission_records_callback():
     
     Handles callbacks for commission record submissions.
     """
-    submission_id = None
-    try:
-        data = validate_json_payload()
-        
-        required_fields = [
-            'submissionId', 'submissionStatus', 'submissionDateTime', 
-            'companyUEN', 'recordType', 'recordPeriod'
-        ]
-        CallbackValidator.validate_required_fields(data, required_fields)
-        
-        submission_id = data['submissionId']
-        submission_status = CallbackValidator.validate_submission_status(data['submissionStatus'])
-        company_uen = CallbackValidator.validate_uen(data['companyUEN'])
-        
-        # Validate optional numeric fields
-        total_records = data.get('totalRecords')
-        total_commission = data.get('totalCommissionAmount')
-        
-        if total_records is not None:
-            try:
-                total_records = int(total_records)
-                if total_records < 0:
-                    raise ValidationError("totalRecords must be non-negative")
-            except (ValueError, TypeError):
-                raise ValidationError("totalRecords must be a valid integer")
-        
-        if total_commission is not None:
-            try:
-                total_commission = float(total_commission)
-                if total_commission < 0:
-                    raise ValidationError("totalCommissionAmount must be non-negative")
-            except (ValueError, TypeError):
-                raise ValidationError("totalCommissionAmount must be a valid number")
-        
-        callback_data = {
-            'submissionId': submission_id,
-            'submissionStatus': submission_status,
-            'submissionDateTime': data['submissionDateTime'],
-            'companyUEN': company_uen,
-            'recordType': data['recordType'],
-            'recordPeriod': data['recordPeriod'],
-            'totalRecords': total_records,
-            'totalCommissionAmount': total_commission,
-            'acknowledgementNumber': data.get('acknowledgementNumber'),
-            'errors': data.get('errors', [])
-        }
-        
-        request_id = log_callback("COMMISSION-RECORDS", callback_data)
-        
-        if submission_status == "SUCCESS":
-            logger.info(f"✅ Commission records submission successful!")
-            logger.info(f"   Record Type: {data['recordType']}")
-            logger.info(f"   Period: {data['recordPeriod']}")
-            if total_records:
-                logger.info(f"   Total Records: {total_records}")
-            if total_commission:
-                logger.info(f"   Total Commission: ${total_commission:,.2f}")
-            message = f"Commission records ({data['recordType']}) for {data['recordPeriod']} processed successfully"
-            
-        elif submission_status == "FAILED":
-            logger.warning(f"❌ Commission records submission failed")
-            if data.get('errors'):
-                logger.warning(f"   Errors: {', '.join(data['errors'])}")
-            message = f"Commission records ({data['recordType']}) submission failed"
-            
-        else:
-            logger.info(f"⏳ Commission records submission status: {submission_status}")
-            message = f"Commission records ({data['recordType']}) submission is {submission_status.lower()}"
-        
-        response = create_success_response(message, submission_id, request_id)
-        return jsonify(response), 200
-        
-    except ValidationError as e:
-        response, status_code = create_error_response(e, submission_id, 400)
-        return jsonify(response), status_code
-    except Exception as e:
-        response, status_code = create_error_response(e, submission_id, 500)
-        return jsonify(response), status_code
+    return _process_callback(COMMISSION_RECORDS_SPEC)
 
 @app.route("/iras/donation-records/callback", methods=["POST"])
 def donation_records_callback():
@@ -620,84 +829,7 @@ def donation_records_callback():
     
     Handles callbacks for donation record submissions.
     """
-    submission_id = None
-    try:
-        data = validate_json_payload()
-        
-        required_fields = [
-            'submissionId', 'submissionStatus', 'submissionDateTime', 
-            'companyUEN', 'donationType', 'donationPeriod'
-        ]
-        CallbackValidator.validate_required_fields(data, required_fields)
-        
-        submission_id = data['submissionId']
-        submission_status = CallbackValidator.validate_submission_status(data['submissionStatus'])
-        company_uen = CallbackValidator.validate_uen(data['companyUEN'])
-        
-        # Validate optional numeric fields
-        total_donations = data.get('totalDonations')
-        total_amount = data.get('totalDonationAmount')
-        
-        if total_donations is not None:
-            try:
-                total_donations = int(total_donations)
-                if total_donations < 0:
-                    raise ValidationError("totalDonations must be non-negative")
-            except (ValueError, TypeError):
-                raise ValidationError("totalDonations must be a valid integer")
-        
-        if total_amount is not None:
-            try:
-                total_amount = float(total_amount)
-                if total_amount < 0:
-                    raise ValidationError("totalDonationAmount must be non-negative")
-            except (ValueError, TypeError):
-                raise ValidationError("totalDonationAmount must be a valid number")
-        
-        callback_data = {
-            'submissionId': submission_id,
-            'submissionStatus': submission_status,
-            'submissionDateTime': data['submissionDateTime'],
-            'companyUEN': company_uen,
-            'donationType': data['donationType'],
-            'donationPeriod': data['donationPeriod'],
-            'totalDonations': total_donations,
-            'totalDonationAmount': total_amount,
-            'acknowledgementNumber': data.get('acknowledgementNumber'),
-            'errors': data.get('errors', [])
-        }
-        
-        request_id = log_callback("DONATION-RECORDS", callback_data)
-        
-        if submission_status == "SUCCESS":
-            logger.info(f"✅ Donation records submission successful!")
-            logger.info(f"   Donation Type: {data['donationType']}")
-            logger.info(f"   Period: {data['donationPeriod']}")
-            if total_donations:
-                logger.info(f"   Total Donations: {total_donations}")
-            if total_amount:
-                logger.info(f"   Total Amount: ${total_amount:,.2f}")
-            message = f"Donation records ({data['donationType']}) for {data['donationPeriod']} processed successfully"
-            
-        elif submission_status == "FAILED":
-            logger.warning(f"❌ Donation records submission failed")
-            if data.get('errors'):
-                logger.warning(f"   Errors: {', '.join(data['errors'])}")
-            message = f"Donation records ({data['donationType']}) submission failed"
-            
-        else:
-            logger.info(f"⏳ Donation records submission status: {submission_status}")
-            message = f"Donation records ({data['donationType']}) submission is {submission_status.lower()}"
-        
-        response = create_success_response(message, submission_id, request_id)
-        return jsonify(response), 200
-        
-    except ValidationError as e:
-        response, status_code = create_error_response(e, submission_id, 400)
-        return jsonify(response), status_code
-    except Exception as e:
-        response, status_code = create_error_response(e, submission_id, 500)
-        return jsonify(response), status_code
+    return _process_callback(DONATION_RECORDS_SPEC)
 
 @app.route("/iras/e-stamping/callback", methods=["POST"])
 def e_stamping_callback():
@@ -706,72 +838,7 @@ def e_stamping_callback():
     
     Handles callbacks for e-stamping submissions.
     """
-    submission_id = None
-    try:
-        data = validate_json_payload()
-        
-        required_fields = [
-            'submissionId', 'submissionStatus', 'submissionDateTime', 
-            'companyUEN', 'documentType'
-        ]
-        CallbackValidator.validate_required_fields(data, required_fields)
-        
-        submission_id = data['submissionId']
-        submission_status = CallbackValidator.validate_submission_status(data['submissionStatus'])
-        company_uen = CallbackValidator.validate_uen(data['companyUEN'])
-        
-        # Validate optional stamp duty field
-        stamp_duty = data.get('stampDuty')
-        if stamp_duty is not None:
-            try:
-                stamp_duty = float(stamp_duty)
-                if stamp_duty < 0:
-                    raise ValidationError("stampDuty must be non-negative")
-            except (ValueError, TypeError):
-                raise ValidationError("stampDuty must be a valid number")
-        
-        callback_data = {
-            'submissionId': submission_id,
-            'submissionStatus': submission_status,
-            'submissionDateTime': data['submissionDateTime'],
-            'companyUEN': company_uen,
-            'documentType': data['documentType'],
-            'stampDuty': stamp_duty,
-            'stampCertificateNumber': data.get('stampCertificateNumber'),
-            'acknowledgementNumber': data.get('acknowledgementNumber'),
-            'errors': data.get('errors', [])
-        }
-        
-        request_id = log_callback("E-STAMPING", callback_data)
-        
-        if submission_status == "SUCCESS":
-            logger.info(f"✅ E-stamping submission successful!")
-            logger.info(f"   Document Type: {data['documentType']}")
-            if stamp_duty:
-                logger.info(f"   Stamp Duty: ${stamp_duty:,.2f}")
-            if data.get('stampCertificateNumber'):
-                logger.info(f"   Certificate Number: {data['stampCertificateNumber']}")
-            message = f"E-stamping for {data['documentType']} processed successfully"
-            
-        elif submission_status == "FAILED":
-            logger.warning(f"❌ E-stamping submission failed")
-            if data.get('errors'):
-                logger.warning(f"   Errors: {', '.join(data['errors'])}")
-            message = f"E-stamping for {data['documentType']} submission failed"
-            
-        else:
-            logger.info(f"⏳ E-stamping submission status: {submission_status}")
-            message = f"E-stamping for {data['documentType']} submission is {submission_status.lower()}"
-        
-        response = create_success_response(message, submission_id, request_id)
-        return jsonify(response), 200
-        
-    except ValidationError as e:
-        response, status_code = create_error_response(e, submission_id, 400)
-        return jsonify(response), status_code
-    except Exception as e:
-        response, status_code = create_error_response(e, submission_id, 500)
-        return jsonify(response), status_code
+    return _process_callback(E_STAMPING_SPEC)
 
 # ================================
 # Testing and Monitoring Endpoints
@@ -788,106 +855,123 @@ def get_callback_logs():
     try:
         limit = request.args.get('limit', 10, type=int)
         limit = min(limit, 50)  # Prevent excessive data transfer
-        recent_logs = callback_logs[-limit:] if callback_logs else []
+        with _logs_lock:
+            total_callbacks = len(callback_logs)
+            recent_entries = list(islice(callback_logs, max(0, total_callbacks - limit), None))
+        recent_logs = [entry.to_dict() for entry in recent_entries]
         
-        return jsonify({
-            "total_callbacks": len(callback_logs),
+        return _json_response({
+            "total_callbacks": total_callbacks,
             "returned_logs": len(recent_logs),
             "logs": recent_logs
         })
     except Exception as e:
-        logger.error(f"Error retrieving logs: {str(e)}")
+        logger.error("Error retrieving logs: %s", e)
         response, status_code = create_error_response(e, status_code=500)
-        return jsonify(response), status_code
+        return _json_response(response, status_code)
 
 @app.route("/logs/stats", methods=["GET"])
 def get_callback_stats():
     """Get callback statistics and summary"""
     try:
-        if not callback_logs:
-            return jsonify({"message": "No callbacks received yet"})
-        
-        # Calculate statistics
-        status_counts = {}
-        endpoint_counts = {}
-        recent_activity = []
-        
-        for log in callback_logs:
-            # Count by status
-            status = log.get('status', 'UNKNOWN')
-            status_counts[status] = status_counts.get(status, 0) + 1
+        with _logs_lock:
+            if not callback_logs:
+                return _json_response({"message": "No callbacks received yet"})
             
-            # Count by endpoint
-            endpoint = log.get('endpoint', 'UNKNOWN')
-            endpoint_counts[endpoint] = endpoint_counts.get(endpoint, 0) + 1
+            # Breakdowns are maintained incrementally by log_callback
+            total_callbacks = len(callback_logs)
+            status_counts = dict(+status_counter)  # Unary + drops zero counts
+            endpoint_counts = dict(+endpoint_counter)
+            recent_logs = list(islice(callback_logs, max(0, total_callbacks - 10), None))
         
         # Get recent activity (last 10 callbacks)
-        for log in callback_logs[-10:]:
-            recent_activity.append({
-                "timestamp": log.get('timestamp'),
-                "endpoint": log.get('endpoint'),
-                "status": log.get('status'),
-                "submissionId": log.get('callback_data', {}).get('submissionId', 'N/A')
-            })
+        recent_activity = [
+            {
+                "timestamp": log.timestamp,
+                "endpoint": log.endpoint,
+                "status": log.status,
+                "submissionId": log.callback_data.get('submissionId', 'N/A')
+            }
+            for log in recent_logs
+        ]
         
-        return jsonify({
-            "total_callbacks": len(callback_logs),
+        return _json_response({
+            "total_callbacks": total_callbacks,
             "status_breakdown": status_counts,
             "endpoint_breakdown": endpoint_counts,
-            "latest_callback": callback_logs[-1]['timestamp'] if callback_logs else None,
+            "latest_callback": recent_logs[-1].timestamp,
             "recent_activity": recent_activity
         })
     except Exception as e:
-        logger.error(f"Error calculating stats: {str(e)}")
+        logger.error("Error calculating stats: %s", e)
         response, status_code = create_error_response(e, status_code=500)
-        return jsonify(response), status_code
+        return _json_response(response, status_code)
 
 @app.route("/logs", methods=["DELETE"])
 def clear_logs():
     """Clear all callback logs (for testing)"""
     try:
-        global callback_logs
-        logs_cleared = len(callback_logs)
-        callback_logs.clear()
+        with _logs_lock:
+            logs_cleared = len(callback_logs)
+            callback_logs.clear()
+            status_counter.clear()
+            endpoint_counter.clear()
         
-        logger.info(f"🧹 Cleared {logs_cleared} callback logs")
+        logger.info("🧹 Cleared %d callback logs", logs_cleared)
         
-        return jsonify({
+        return _json_response({
             "message": f"Cleared {logs_cleared} callback logs",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": g.now_iso
         })
     except Exception as e:
-        logger.error(f"Error clearing logs: {str(e)}")
+        logger.error("Error clearing logs: %s", e)
         response, status_code = create_error_response(e, status_code=500)
-        return jsonify(response), status_code
+        return _json_response(response, status_code)
 
 # ================================
 # Mock Testing Endpoints
 # ================================
 
+# Templates for the mock callbacks; None fields are filled in per call
+_MOCK_GST_TEMPLATE = {
+    "submissionId": None,
+    "submissionStatus": "SUCCESS",
+    "formType": "F5",
+    "submissionDateTime": None,
+    "companyUEN": "201234567D",
+    "taxPeriod": "202412",
+    "acknowledgementNumber": None,
+    "totalTaxAmount": 15000.50,
+    "errors": None
+}
+_MOCK_FORM_CS_TEMPLATE = {
+    "submissionId": None,
+    "submissionStatus": "SUCCESS",
+    "submissionDateTime": None,
+    "companyUEN": "201234567D",
+    "formVersion": "2025.1",
+    "filingType": "ANNUAL_RETURN",
+    "effectiveDate": "2025-01-01",
+    "acknowledgementNumber": None,
+    "errors": None
+}
+
+def _build_mock_data(template: dict, id_prefix: str) -> dict:
+    """Copy a mock callback template and fill in its per-call fields"""
+    mock_data = dict(template)
+    mock_data["submissionId"] = _generate_id(id_prefix)
+    mock_data["submissionDateTime"] = g.now_iso
+    mock_data["acknowledgementNumber"] = _generate_id("ACK")
+    mock_data["errors"] = []
+    return mock_data
+
 @app.route("/test/mock-gst-callback", methods=["POST"])
 def test_mock_gst_callback():
     """Generate and process a mock GST callback for testing"""
     try:
-        # Create mock GST callback data
-        mock_data = {
-            "submissionId": f"GST{datetime.now().strftime('%Y%m%d%H%M%S')}",
-            "submissionStatus": "SUCCESS",
-            "formType": "F5",
-            "submissionDateTime": datetime.now().isoformat(),
-            "companyUEN": "201234567D",
-            "taxPeriod": "202412",
-            "acknowledgementNumber": f"ACK{datetime.now().strftime('%Y%m%d%H%M%S')}",
-            "totalTaxAmount": 15000.50,
-            "errors": []
-        }
-        
-        # Process the mock callback internally
-        with app.test_request_context('/test/mock-gst-callback', 
-                                    method='POST', 
-                                    json=mock_data,
-                                    headers={'Content-Type': 'application/json'}):
-            request_id = log_callback("GST-RETURN-TEST", mock_data)
+        # Create and log mock GST callback data
+        mock_data = _build_mock_data(_MOCK_GST_TEMPLATE, "GST")
+        request_id = log_callback("GST-RETURN-TEST", mock_data)
         
         response = create_success_response(
             "Mock GST F5 submission for period 202412 processed successfully",
@@ -895,36 +979,21 @@ def test_mock_gst_callback():
             request_id
         )
         
-        return jsonify({
+        return _json_response({
             "message": "Mock GST callback generated and processed successfully",
             "mock_data": mock_data,
             "callback_response": response
         })
     except Exception as e:
         response, status_code = create_error_response(e, status_code=500)
-        return jsonify(response), status_code
+        return _json_response(response, status_code)
 
 @app.route("/test/mock-form-cs-callback", methods=["POST"])
 def test_mock_form_cs_callback():
     """Generate and process a mock Form CS callback for testing"""
     try:
-        mock_data = {
-            "submissionId": f"CS{datetime.now().strftime('%Y%m%d%H%M%S')}",
-            "submissionStatus": "SUCCESS",
-            "submissionDateTime": datetime.now().isoformat(),
-            "companyUEN": "201234567D",
-            "formVersion": "2025.1",
-            "filingType": "ANNUAL_RETURN",
-            "effectiveDate": "2025-01-01",
-            "acknowledgementNumber": f"ACK{datetime.now().strftime('%Y%m%d%H%M%S')}",
-            "errors": []
-        }
-        
-        with app.test_request_context('/test/mock-form-cs-callback', 
-                                    method='POST', 
-                                    json=mock_data,
-                                    headers={'Content-Type': 'application/json'}):
-            request_id = log_callback("FORM-CS-TEST", mock_data)
+        mock_data = _build_mock_data(_MOCK_FORM_CS_TEMPLATE, "CS")
+        request_id = log_callback("FORM-CS-TEST", mock_data)
         
         response = create_success_response(
             "Form CS (ANNUAL_RETURN) submission processed successfully",
@@ -932,14 +1001,18 @@ def test_mock_form_cs_callback():
             request_id
         )
         
-        return jsonify({
+        return _json_response({
             "message": "Mock Form CS callback generated and processed successfully",
             "mock_data": mock_data,
             "callback_response": response
         })
     except Exception as e:
         response, status_code = create_error_response(e, status_code=500)
-        return jsonify(response), status_code
+        return _json_response(response, status_code)
+
+# Callback types that /test/validate-callback checks against the base fields only
+_BASE_CALLBACK_TYPES = frozenset({'form-cs', 'commission-records', 'donation-records', 'e-stamping'})
+_BASE_REQUIRED_FIELDS = ('submissionId', 'submissionStatus', 'submissionDateTime', 'companyUEN')
 
 @app.route("/test/validate-callback", methods=["POST"])
 def test_validate_callback():
@@ -951,40 +1024,35 @@ def test_validate_callback():
         callback_type = request.args.get('type', 'gst-return')
         
         if callback_type == 'gst-return':
-            required_fields = [
-                'submissionId', 'submissionStatus', 'formType', 
-                'submissionDateTime', 'companyUEN', 'taxPeriod'
-            ]
-            CallbackValidator.validate_required_fields(data, required_fields)
+            CallbackValidator.validate_required_fields(data, GST_RETURN_SPEC.required_fields)
             CallbackValidator.validate_submission_status(data['submissionStatus'])
             CallbackValidator.validate_form_type(data['formType'])
             CallbackValidator.validate_uen(data['companyUEN'])
             CallbackValidator.validate_tax_period(data['taxPeriod'])
             
-        elif callback_type in ['form-cs', 'commission-records', 'donation-records', 'e-stamping']:
-            base_required = ['submissionId', 'submissionStatus', 'submissionDateTime', 'companyUEN']
-            CallbackValidator.validate_required_fields(data, base_required)
+        elif callback_type in _BASE_CALLBACK_TYPES:
+            CallbackValidator.validate_required_fields(data, _BASE_REQUIRED_FIELDS)
             CallbackValidator.validate_submission_status(data['submissionStatus'])
             CallbackValidator.validate_uen(data['companyUEN'])
         
-        return jsonify({
+        return _json_response({
             "status": "valid",
             "message": f"Callback data validation passed for {callback_type}",
             "validated_data": data,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": g.now_iso
         })
         
     except ValidationError as e:
-        return jsonify({
+        return _json_response({
             "status": "invalid",
             "message": "Validation failed",
             "error": str(e),
             "field": getattr(e, 'field', None),
-            "timestamp": datetime.now().isoformat()
-        }), 400
+            "timestamp": g.now_iso
+        }, 400)
     except Exception as e:
         response, status_code = create_error_response(e, status_code=500)
-        return jsonify(response), status_code
+        return _json_response(response, status_code)
 
 # ================================
 # Error Handlers
@@ -993,8 +1061,8 @@ def test_validate_callback():
 @app.errorhandler(404)
 def not_found_handler(error):
     """Handle 404 errors with helpful message"""
-    logger.warning(f"404 error: {request.url} not found")
-    return jsonify({
+    logger.warning("404 error: %s not found", request.url)
+    return _json_response({
         "status": "error",
         "message": "Endpoint not found",
         "requested_url": request.url,
@@ -1008,64 +1076,78 @@ def not_found_handler(error):
             "/docs",
             "/logs"
         ],
-        "timestamp": datetime.now().isoformat()
-    }), 404
+        "timestamp": g.now_iso
+    }, 404)
 
 @app.errorhandler(405)
 def method_not_allowed_handler(error):
     """Handle 405 errors (method not allowed)"""
-    logger.warning(f"405 error: Method {request.method} not allowed for {request.url}")
-    return jsonify({
+    logger.warning("405 error: Method %s not allowed for %s", request.method, request.url)
+    return _json_response({
         "status": "error",
         "message": f"Method {request.method} not allowed for this endpoint",
         "allowed_methods": ["GET", "POST"] if "callback" in request.url else ["GET"],
-        "timestamp": datetime.now().isoformat()
-    }), 405
+        "timestamp": g.now_iso
+    }, 405)
 
 @app.errorhandler(400)
 def bad_request_handler(error):
     """Handle 400 errors (bad request)"""
-    logger.warning(f"400 error: Bad request for {request.url}")
-    return jsonify({
+    logger.warning("400 error: Bad request for %s", request.url)
+    return _json_response({
         "status": "error",
         "message": "Bad request - please check your request format",
-        "timestamp": datetime.now().isoformat()
-    }), 400
+        "timestamp": g.now_iso
+    }, 400)
 
 @app.errorhandler(500)
 def internal_error_handler(error):
     """Handle 500 errors (internal server error)"""
-    error_id = str(uuid.uuid4())[:8]
-    logger.error(f"500 error - Error ID: {error_id}")
-    logger.error(f"   URL: {request.url}")
-    logger.error(f"   Method: {request.method}")
-    logger.error(f"   Error: {str(error)}")
-    logger.error(f"   Traceback: {traceback.format_exc()}")
+    error_id = urandom(4).hex()
+    logger.error("500 error - Error ID: %s", error_id)
+    logger.error("   URL: %s", request.url)
+    logger.error("   Method: %s", request.method)
+    logger.error("   Error: %s", error)
+    logger.error("   Traceback:", exc_info=True)
     
-    return jsonify({
+    return _json_response({
         "status": "error",
         "message": "Internal server error",
         "error_id": error_id,
-        "timestamp": datetime.now().isoformat()
-    }), 500
+        "timestamp": g.now_iso
+    }, 500)
 
 # ================================
 # Application Startup/Shutdown
 # ================================
 
+_startup_lock = threading.Lock()
+_started_pid = None  # PID that has run startup (workers forked after import start their own)
+
 @app.before_request
 def startup_event():
-    """Application startup event"""
+    """Application startup event (runs once per process)"""
+    global _started_pid
+    if _started_pid == os.getpid():
+        return
+    with _startup_lock:
+        if _started_pid == os.getpid():
+            return
+        _log_listener.start()
+        atexit.register(shutdown_event)
+        _started_pid = os.getpid()
+    
     logger.info("🚀 IRAS Callback API Server starting up...")
-    logger.info(f"   Platform:  App Hosting + Flask")
-    logger.info(f"   Endpoints: 5 callback endpoints + monitoring")
-    logger.info(f"   Documentation available at: /docs")
-    logger.info(f"   Health check available at: /health")
+    logger.info("   Platform:  App Hosting + Flask")
+    logger.info("   Endpoints: 5 callback endpoints + monitoring")
+    logger.info("   Documentation available at: /docs")
+    logger.info("   Health check available at: /health")
 
 def shutdown_event():
-    """Application shutdown event (called manually if needed)"""
+    """Application shutdown event (registered with atexit by startup_event)"""
     logger.info("📴 IRAS Callback API Server shutting down...")
-    logger.info(f"   Total callbacks processed: {len(callback_logs)}")
+    logger.info("   Total callbacks processed: %d", len(callback_logs))
+    _log_listener.stop()  # Flushes queued records before exit
 
 # ================================
 # Production WSGI Entry Point
@@ -1083,9 +1165,10 @@ if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
     debug_mode = os.environ.get("FLASK_ENV") == "development"
     
-    logger.info(f"🔥 Starting IRAS Callback API on port {port}")
-    logger.info(f"   Debug mode: {debug_mode}")
-    logger.info(f"   Environment: {os.environ.get('FLASK_ENV', 'production')}")
+    startup_event()  # Start the log listener before the server begins logging
+    logger.info("🔥 Starting IRAS Callback API on port %d", port)
+    logger.info("   Debug mode: %s", debug_mode)
+    logger.info("   Environment: %s", os.environ.get('FLASK_ENV', 'production'))
     
     app.run(
         host="0.0.0.0",